@@ -1,10 +1,99 @@
 import argparse
+import logging
+import mmap
+import os
+import struct
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import BinaryIO, Tuple, Union
 
 from mpegi.namespace import GENRES, PICTURE_TYPE
-from mpegi.utils import rm_unsync
+from mpegi.utils import rm_unsync, syncsafe
+
+# ID3v2 frame header: 4-byte identifier followed by a 32-bit big-endian
+# size. The two flag bytes are not interpreted yet.
+_FRAME_HEADER = struct.Struct(">4sI")
+
+logger = logging.getLogger(__name__)
+
+# ID3v2 tag header: identifier, major/minor version, flags and the
+# 4 syncsafe size bytes, unpacked in one call.
+_ID3_HDR = struct.Struct(">3sBBB4s")
+
+# TAGv1 is a fixed 128-byte layout; one unpack replaces seven slices.
+# The byte before the genre holds an optional track number (unused).
+_TAGV1 = struct.Struct(">3s30s30s30s4s29s1s1s")
+
+# Translation table that strips control characters from decoded frame
+# text in one C-level pass (newlines, carriage returns and tabs are
+# kept). Replaces the old per-character comprehension, which compared
+# each codepoint but mapped both branches to the same value.
+_STRIP_CONTROL = {
+    c: None for c in range(32) if c not in (0x09, 0x0A, 0x0D)
+}
+_STRIP_CONTROL[0x7F] = None
+
+# SYLT/SYTC lookup tables, indexed by the raw byte value. Module-level
+# so the dicts are not rebuilt per frame.
+_TIMESTAMP_FORMATS = (
+    "Unknown format",
+    "Absolute time, 32 bit sized, using MPEG frames as unit",
+    "Absolute time, 32 bit sized, using milliseconds as unit",
+)
+
+# URL link frames defined by ID3v2.3/2.4 (WXXX is user-defined and
+# handled separately). One hash lookup replaces the old
+# startswith/len chain.
+_URL_FRAMES = frozenset(
+    ("WCOM", "WCOP", "WOAF", "WOAR", "WOAS", "WORS", "WPAY", "WPUB")
+)
+
+# Saved-image extension by APIC MIME type; unknown types get .bin.
+_MIME_EXT = {
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/bmp": ".bmp",
+    "image/webp": ".webp",
+}
+
+# Smallest body (including the encoding byte) each structured handler
+# can parse: language codes, timestamp/content bytes and separators.
+# Degenerate frames below the minimum are dropped instead of indexing
+# past the end of a 1-byte body.
+_MIN_BODY = {
+    "COMM": 5,
+    "USLT": 5,
+    "SYLT": 7,
+    "SYTC": 3,
+    "APIC": 4,
+    "GEOB": 2,
+}
+
+# Frames whose payloads dominate tag size (cover art, encapsulated
+# objects, synced lyrics, private blobs). Library scans that do not ask
+# for images step over these without copying their bodies.
+_HEAVY_FRAMES = frozenset(("APIC", "GEOB", "PRIV", "SYLT"))
+
+# Decoded language codes keyed by their raw 3 bytes. Real libraries
+# reuse a handful of codes (eng, jpn, ...), so the codec runs once per
+# distinct code instead of once per frame.
+_LANG_CACHE = {}
+
+_SYLT_CONTENT_TYPES = (
+    "Other",
+    "Lyrics",
+    "Text transcription",
+    "Movement/part name",
+    "Events",
+    "Chord",
+    "Trivia",
+    "URLs to webpages",
+    "URLs to images",
+)
 
 
 class Tag:
@@ -17,17 +106,93 @@ class Tag:
         print(tag.get())
     """
 
+    __slots__ = ("audio", "kinds", "debug", "stream")
+
     TAGV1 = b"TAG"
     TAGV2 = b"ID3"
 
-    def __init__(self, audio: Path):
+    def __init__(self, audio: Path, kinds=frozenset(("v1", "v2")), debug=False):
         self.audio = audio
+        # Which TAG spaces to probe; scans that only want one version
+        # skip the other's read entirely.
+        self.kinds = kinds
+        # Pretty-printed flag strings are only built when asked for.
+        self.debug = debug
         self.stream: BinaryIO = self.audio.open("rb")
 
-    def get(self, save_image: bool = False):
+    @classmethod
+    def scan(cls, paths, save_image: bool = False, wanted=None):
+        """
+        Lazily yields (path, tag data) pairs for a batch of MP3s.
+
+        Header probes go through os.pread on the file descriptor, so
+        each untagged file costs two reads. Files without a TAG space
+        or with unreadable tags are skipped, mirroring Metadata.scan.
+        wanted is passed through to get, restricting ID3v2 parsing to
+        those frame ids.
+        """
+        for path in paths:
+            try:
+                yield path, cls(path).get(save_image, wanted)
+            except Exception:
+                continue
+
+    @classmethod
+    def scan_many(
+        cls, paths, save_image: bool = False, workers: int = 8, wanted=None
+    ):
+        """
+        Parallel variant of scan for large libraries.
+
+        Parsing is I/O-bound and the positioned reads release the GIL,
+        so a small thread pool overlaps disk latency across files.
+        Returns (path, tag data) pairs in input order, skipping files
+        without a readable TAG space.
+        """
+
+        def parse(path):
+            try:
+                return path, cls(path).get(save_image, wanted)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [pair for pair in executor.map(parse, paths) if pair]
+
+    @classmethod
+    def scan_columns(cls, paths, frame_ids=("TIT2", "TPE1", "TALB", "TCON")):
+        """
+        Scans a batch of MP3s into parallel columns, one list per
+        requested frame id plus a "path" column.
+
+        Column layout keeps bulk queries ("all distinct TPE1 values")
+        on flat lists instead of millions of per-file dicts. Only the
+        requested frame ids are decoded; everything else in each tag
+        is stepped over.
+        """
+        columns = {"path": []}
+        for frame_id in frame_ids:
+            columns[frame_id] = []
+
+        for path, metadata in cls.scan(paths, wanted=frozenset(frame_ids)):
+            if isinstance(metadata, tuple):
+                metadata = metadata[1]
+            frames = metadata.get("Frames") if isinstance(metadata, dict) else None
+            if frames is None:
+                continue
+            columns["path"].append(path)
+            for frame_id in frame_ids:
+                columns[frame_id].append(frames.get(frame_id))
+
+        return columns
+
+    def get(self, save_image: bool = False, wanted=None):
         """
         Determines which TAG version the given audio file is
         and runs the corresponding method.
+
+        wanted optionally restricts ID3v2 parsing to a set of frame
+        ids; anything else is stepped over without decoding.
         """
         stream = self.get_stream()
 
@@ -38,12 +203,12 @@ class Tag:
             get_tag = getattr(self, stream[0])
 
             if stream[0] == "get_v2":
-                return get_tag(stream[1], save_image)
+                return get_tag(stream[1], save_image, wanted)
 
             return get_tag(stream[1])
 
         if isinstance(stream[0], bytes):
-            return self.get_v1(stream[0]), self.get_v2(stream[1], save_image)
+            return self.get_v1(stream[0]), self.get_v2(stream[1], save_image, wanted)
 
         raise Exception("Unexpected stream format.")
 
@@ -59,20 +224,28 @@ class Tag:
         headerv1 = None
         headerv2 = None
 
+        fd = self.stream.fileno()
+        filesize = os.fstat(fd).st_size
+
         # Check for TAGv1 at the end of the file
         # TAGv1 is always the last 128 bytes in the file (if present)
-        self.stream.seek(-128, 2)
-        tag = self.stream.read(3)
-        if tag == self.TAGV1:
-            self.stream.seek(-128, 2)
-            headerv1 = self.stream.read(128)
+        # One positioned read into a local, so concurrent scans
+        # (Tag.scan_many) cannot clobber each other's tail.
+        if "v1" in self.kinds and filesize >= 128:
+            tail = os.pread(fd, 128, filesize - 128)
+            if len(tail) == 128 and tail[:3] == self.TAGV1:
+                headerv1 = tail
 
         # Check for TAGv2 at the beginning of the file
-        self.stream.seek(0)
-        tag = self.stream.read(3)
-        if tag == self.TAGV2:
-            self.stream.seek(-3, 1)
-            headerv2 = self.stream.read(10)
+        if "v2" in self.kinds:
+            head = os.pread(fd, 10, 0)
+        else:
+            head = b""
+        if head[:3] == self.TAGV2:
+            headerv2 = head
+            # Leave the buffered stream positioned right after the
+            # header so get_v2 can read the tag body sequentially.
+            self.stream.seek(10)
 
         if headerv1 and headerv2:
             return (headerv1, headerv2)
@@ -90,17 +263,27 @@ class Tag:
         """
         Get data from TAGv1 space.
         """
-        metadata = {}
-
-        metadata["Identifier"] = stream[:3]
-        metadata["Title"] = stream[3:33]
-        metadata["Artist"] = stream[33:63]
-        metadata["Album"] = stream[63:93]
-        metadata["Year"] = stream[93:97]
-        metadata["Comments"] = stream[97:126]
-        # Ignoring potential Track Number on 126
-        # metadata["Track"] = stream[126:127]
-        metadata["Genre"] = stream[127:128]
+        (
+            identifier,
+            title,
+            artist,
+            album,
+            year,
+            comments,
+            _track,
+            genre,
+        ) = _TAGV1.unpack(stream)
+
+        metadata = {
+            "Identifier": identifier,
+            "Title": title,
+            "Artist": artist,
+            "Album": album,
+            "Year": year,
+            "Comments": comments,
+            # Ignoring potential Track Number on 126
+            "Genre": genre,
+        }
 
         return self._clean(metadata)
 
@@ -109,127 +292,211 @@ class Tag:
         Cleans data from TAGV1 space.
         """
         for label, value in metadata.items():
-            if isinstance(value, bytes):
-                value = value.decode("utf-8", "ignore")
-
-            if label == "Genre" and len(value) != 0:
-                idx = ord(value)
-                try:
-                    value = GENRES[idx]
-                except:
-                    pass
-            else:
-                value = value.replace("\x00", "").strip()
-
-            if value == "":
-                value = None
+            if label == "Genre":
+                # Index the genre byte directly; the GENRES tuple is
+                # padded with None, so out-of-spec bytes (148-255,
+                # including the conventional 0xFF "no genre" marker)
+                # come back as None.
+                metadata[label] = GENRES[value[0]] if value else None
+                continue
 
-            metadata[label] = value
+            # TAGv1 text is latin-1 per spec; strip padding in bytes
+            # space (C loops) before the single decode.
+            value = value.replace(b"\x00", b"").strip().decode("latin-1")
+            metadata[label] = value or None
 
         return metadata
 
-    def get_v2(self, stream: bytes, save_image: bool):
+    def get_v2(self, stream: bytes, save_image: bool, wanted=None):
         """
         Gets data from TAGv2 space.
         """
         metadata = {}
 
-        metadata["Identifier"] = stream[:3]
-        metadata["Version"] = str(stream[3:4][0]) + "." + str(stream[4:5][0])
-        metadata["Full Version"] = "ID3v2" + "." + metadata["Version"]
+        identifier, major, minor, flags, size_bytes = _ID3_HDR.unpack(stream)
+
+        metadata["Identifier"] = identifier
+        metadata["Version"] = f"{major}.{minor}"
+        metadata["Full Version"] = f"ID3v2.{major}.{minor}"
 
         # Ignore the following tags: https://id3.org/id3v2.4.0-structure
         # Only up to 2.4.0 is backwards compatible -- above versions are experimental
-        if stream[3:4][0] >= 5:
+        if major >= 5:
             return metadata
 
-        flags = stream[5]  # 0b00000000
+        # flags -- 0b00000000
         metadata["Flags"] = flags
-        metadata["Flags Hex"] = f"{flags:02x}"
-        metadata["Flags Bits"] = f"{flags:08b}"
+        if self.debug:
+            metadata["Flags Hex"] = f"{flags:02x}"
+            metadata["Flags Bits"] = f"{flags:08b}"
 
         # Below are the flag settings:
 
         # A set bit indicates unsynchronisation is applied on all frames.
-        unsynchronisation = (flags & 0b10000000) >> 7
+        unsynchronisation = bool(flags & 0b10000000)
         # A set bit indicates the presence of an extended header.
-        extended_header = (flags & 0b01000000) >> 6
+        extended_header = bool(flags & 0b01000000)
         # SHALL always be set when the tag is in an experimental stage.
-        experimental_indicator = (flags & 0b00100000) >> 5
+        experimental_indicator = bool(flags & 0b00100000)
         # A set bit indicates the presence of a footer at the end of the tag.
-        footer_present = (flags & 0b00010000) >> 4
+        footer_present = bool(flags & 0b00010000)
 
-        metadata["Unsynchronisation"] = bool(unsynchronisation)
-        metadata["Extended Header"] = bool(extended_header)
-        metadata["Experimental Indicator"] = bool(experimental_indicator)
-        metadata["Footer Present"] = bool(footer_present)
+        metadata["Unsynchronisation"] = unsynchronisation
+        metadata["Extended Header"] = extended_header
+        metadata["Experimental Indicator"] = experimental_indicator
+        metadata["Footer Present"] = footer_present
 
         # idx = 6
-        if extended_header == 1:
+        if extended_header:
             # Maybe add extended_header info support in the future:
             return "Extended Header"
 
-        # Check if other flags are cleared
-        sequences = (0b00001000, 0b00000100, 0b00000010, 0b00000001)
-        shift = 3
-        for sequence in sequences:
-            if (flags & sequence) >> shift == 1:
-                metadata["Other Flags"] = "NOT CLEARED"
-                print("Undefined flag(s) are set.")
-                return metadata
-
-            shift -= 1
+        # The low four flag bits are undefined and must be cleared
+        if flags & 0b00001111:
+            metadata["Other Flags"] = "NOT CLEARED"
+            print("Undefined flag(s) are set.")
+            return metadata
 
         metadata["Other Flags"] = "CLEARED"
 
-        size = (
-            (stream[6] & 0x7F) << 21
-            | (stream[7] & 0x7F) << 14
-            | (stream[8] & 0x7F) << 7
-            | (stream[9] & 0x7F)
-        )
-        tag_body = self.stream.read(size)
-
-        if unsynchronisation:
-            tag_body = rm_unsync(tag_body)
-
-        frames = self.get_frames(tag_body, save_image)
+        size = syncsafe(size_bytes)
+        # Map the tag body instead of read()-ing it through the buffered
+        # stream, and keep the map open across the frame walk: the walk
+        # only touches a memoryview, so pages are faulted in lazily by
+        # the OS and skipped frames (large embedded images) are never
+        # read off disk. Unsynchronised tags must be rewritten anyway,
+        # so those fall back to one full copy.
+        try:
+            mapped = mmap.mmap(
+                self.stream.fileno(), 10 + size, access=mmap.ACCESS_READ
+            )
+        except (OSError, ValueError):
+            self.stream.seek(10)
+            tag_body = self.stream.read(size)
+            if unsynchronisation:
+                tag_body = rm_unsync(tag_body)
+            frames = self.get_frames(tag_body, save_image, wanted)
+        else:
+            try:
+                view = memoryview(mapped)[10:]
+                try:
+                    if unsynchronisation:
+                        frames = self.get_frames(
+                            rm_unsync(bytes(view)), save_image, wanted
+                        )
+                    else:
+                        frames = self.get_frames(view, save_image, wanted)
+                finally:
+                    view.release()
+            finally:
+                mapped.close()
 
         metadata["Frames"] = frames
 
         return metadata
 
-    def get_frames(self, tag_body, save_image):
-        idx = 0
-        frames = {}
-        while idx < len(tag_body):
-            frame_header = tag_body[idx : idx + 10]
-            if len(frame_header) < 10:
-                break
+    def get_frames(self, tag_body, save_image, wanted=None):
+        return dict(self.iter_frames(tag_body, save_image, wanted))
+
+    def iter_frames(self, tag_body, save_image=False, wanted=None):
+        """
+        Lazily yields (frame id, value) pairs from a tag body.
 
-            frame_id = frame_header[:4].decode("ascii")
+        Callers that stop iterating early (or pass wanted) never pay
+        for the frames behind the ones they consumed.
+        """
+        # Normalize up front so lists/tuples work and membership plus
+        # the issubset stop below stay O(1).
+        if wanted is not None:
+            wanted = frozenset(wanted)
+        idx = 0
+        seen = set()
+        # Walk the tag through a memoryview so header fields and skipped
+        # frames never copy bytes; only bodies we decode are materialized.
+        view = memoryview(tag_body)
+        end = len(view)
+        unpack_header = _FRAME_HEADER.unpack_from
+        cached_id = _ID_CACHE.get
+        frame_instance = None
+        while idx + 10 <= end:
+            frame_id, frame_size = unpack_header(view, idx)
+            frame_id = cached_id(frame_id) or frame_id.decode("ascii")
 
-            frame_size = int.from_bytes(frame_header[4:8], byteorder="big")
             if frame_size == 0:
                 idx += 10
                 continue
 
-            frame_body = tag_body[idx + 10 : idx + 10 + frame_size]
+            # Callers that only want a few frames skip the rest without
+            # decoding them, and stop once every id has been seen. An
+            # explicitly wanted id is always parsed, even a heavy one.
+            if wanted is not None:
+                if frame_id not in wanted:
+                    idx += 10 + frame_size
+                    continue
+            # Typical tags are a few KB of text plus up to megabytes of
+            # picture/object payload; skip the latter unless asked for.
+            elif not save_image and frame_id in _HEAVY_FRAMES:
+                idx += 10 + frame_size
+                continue
+
+            frame_body = bytes(view[idx + 10 : idx + 10 + frame_size])
 
             if not frame_body:
                 idx += 10 + frame_size
                 continue
 
-            frame_instance = Frames(
-                frame_body, frame_id, frame_size, save_image=save_image
-            )
+            if frame_instance is None:
+                frame_instance = Frames(
+                    frame_body, frame_id, frame_size, save_image=save_image
+                )
+            else:
+                frame_instance.reset(frame_body, frame_id, frame_size)
 
             processed_frame = frame_instance.process_frame()
             if processed_frame is not None:
-                frames[frame_id] = processed_frame[1]
+                yield frame_id, processed_frame[1]
+                if wanted is not None:
+                    seen.add(frame_id)
+                    if wanted.issubset(seen):
+                        return
             idx += 10 + frame_size
 
-        return frames
+
+@lru_cache(maxsize=1024)
+def _cached_tag(path_str, mtime_ns, size):
+    return Tag(Path(path_str)).get()
+
+
+def _copy_tag(tag):
+    """
+    Copies a cached tag result so callers can mutate their own dict.
+
+    Frame values are immutable (strings and tuples), so copying the
+    outer dict plus the nested "Frames" dict is deep enough.
+    """
+    if isinstance(tag, tuple):
+        return tuple(_copy_tag(part) for part in tag)
+    if isinstance(tag, dict):
+        tag = dict(tag)
+        frames = tag.get("Frames")
+        if isinstance(frames, dict):
+            tag["Frames"] = dict(frames)
+        return tag
+    return tag
+
+
+def read_tag(audio: Path):
+    """
+    Parses the TAG spaces of an MP3, memoized on (path, mtime, size).
+
+    Repeated rescans of unchanged files (GUI refreshes, watch loops)
+    return the cached result without touching the file; any rewrite
+    changes the mtime or size and invalidates the entry. Each call
+    gets its own copy of the result, so mutating one caller's dict
+    cannot corrupt the cache entry behind it.
+    """
+    stat = audio.stat()
+    return _copy_tag(_cached_tag(str(audio), stat.st_mtime_ns, stat.st_size))
 
 
 class Frames:
@@ -239,20 +506,76 @@ class Frames:
     Each frame is used for storing one piece of information, such as Artist or Album.
     """
 
+    __slots__ = (
+        "save_image",
+        "encoding",
+        "encoding_str",
+        "full_body",
+        "_body",
+        "id",
+        "size",
+    )
+
+    # Text encodings by ID3v2 encoding byte; anything out of range is
+    # treated as UTF-8.
+    _ENCODINGS = ("ISO-8859-1", "utf-16", "utf-16-be", "utf-8")
+
     def __init__(self, body, id, size, save_image: bool = False):
-        self.body = body[1:]
+        self.save_image = save_image
+        self.reset(body, id, size)
+
+    @staticmethod
+    def _strip_nulls(body, encoding):
+        """
+        Decodes a text payload with its nulls removed.
+
+        Single-byte encodings drop the nulls in bytes space (one C
+        pass, no oversized intermediate string); UTF-16 keeps them
+        until after decoding since null bytes there are structural.
+        """
+        if encoding.startswith("utf-16"):
+            return body.decode(encoding, "ignore").replace("\x00", "")
+
+        return body.translate(None, b"\x00").decode(encoding, "ignore")
+
+    def reset(self, body, id, size):
+        """
+        Repoints this instance at another frame.
+
+        Lets the tag walk recycle one Frames object instead of
+        allocating one per frame.
+        """
         self.encoding = body[0]
+        # Resolved once: the encoding byte never changes for a frame,
+        # so handlers read the attribute instead of calling a method.
+        self.encoding_str = self._ENCODINGS[
+            self.encoding if self.encoding < 4 else 3
+        ]
         self.full_body = body
+        self._body = None
         self.id = id
         self.size = size
-        self.save_image = save_image
+        return self
+
+    @property
+    def body(self):
+        """
+        Frame body with the encoding byte dropped.
+
+        Sliced lazily: handlers that work on the full body (like _apic)
+        never pay for copying a multi-megabyte payload.
+        """
+        if self._body is None:
+            self._body = self.full_body[1:]
+        return self._body
 
     def process_frame(self):
         # Tag that needs its own method
-        attr = "_" + self.id.lower()
-        if hasattr(self, attr):
-            frm = getattr(self, attr)
-            return frm()
+        handler = self._HANDLERS.get(self.id)
+        if handler is not None:
+            if len(self.full_body) < _MIN_BODY.get(self.id, 1):
+                return None
+            return handler(self)
 
         # Invalid Tag
         if self.size < 1:
@@ -288,7 +611,7 @@ class Frames:
         """
         # user defined has format of encoding, description, text
         if id == "TXXX" or id == "WXXX":
-            encoding = self._encode()
+            encoding = self.encoding_str
             description, null_sep, text = self.body.partition(b"\x00")
             description = description.decode(encoding, "ignore").strip()
             text = text.decode(encoding, "ignore").strip()
@@ -296,27 +619,18 @@ class Frames:
 
         # url text frame has format of just url, or MCDI
         # Attempt at getting URL Link Frames
-        if (
-            id == "MCDI"
-            or id.startswith("W")
-            and not id.startswith("WXXX")
-            and len(id) == 4
-        ):
+        if id == "MCDI" or id in _URL_FRAMES:
             if id == "MCDI":
-                encoding = self._encode()
-                information = self.full_body.decode(encoding, "ignore").replace(
-                    "\x00", ""
-                )
+                information = self._strip_nulls(self.full_body, self.encoding_str)
             else:
-                information = self.full_body.decode("ISO-8859-1", "ignore").replace(
-                    "\x00", ""
+                information = self.full_body.translate(None, b"\x00").decode(
+                    "ISO-8859-1", "ignore"
                 )
 
             return (id, information)
 
         else:
-            encoding = self._encode()
-            information = self.body.decode(encoding, "ignore").replace("\x00", "")
+            information = self._strip_nulls(self.body, self.encoding_str)
 
             if id == "TFLT":
                 types = {
@@ -335,43 +649,47 @@ class Frames:
 
             return (id, information)
 
-    def _encode(self):
-        if self.encoding == 0:
-            return "ISO-8859-1"
-        elif self.encoding == 1:
-            return "utf-16"
-        elif self.encoding == 2:
-            return "utf-16-be"
-        else:
-            return "utf-8"
+    def _language(self):
+        """
+        Returns the 3-byte language code shared by COMM/USLT/SYLT.
 
-    def _comm(self):
-        # come back to this later
-        # text and desc seem to work on some and not others
-        encoding = self._encode()
+        Looked up through _LANG_CACHE; latin-1 cannot fail on 3 bytes,
+        so the old error path is gone.
+        """
+        code = self.body[:3]
+        language = _LANG_CACHE.get(code)
+        if language is None:
+            language = _LANG_CACHE.setdefault(
+                code, code.decode("ISO-8859-1").replace("\x00", "")
+            )
+        return language
 
-        try:
-            language = self.body[:3].decode("ISO-8859-1").replace("\x00", "")
-        except Exception as e:
-            language = None
-            print(f"Error decoding {self.id} language: {e}\n")
+    def _lang_desc(self):
+        """
+        Shared prologue for COMM/USLT frames: a language code, then a
+        null-separated description followed by the text payload.
+        """
+        encoding = self.encoding_str
+        language = self._language()
 
         description, null_sep, text = self.body[3:].partition(b"\x00")
 
         try:
             description = description.decode(encoding)
-        except Exception as e:
+        except Exception:
             description = None
-            print(f"Error decoding {self.id} description: {e}\n")
+            logger.warning("Error decoding %s description", self.id, exc_info=True)
 
-        try:
-            ftext = text.strip(b"\x00").decode(encoding, "ignore")
-            ftext = "".join(
-                [char if 32 <= ord(char) <= 126 else char for char in ftext]
-            )
-        except Exception as e:
-            ftext = None
-            print(f"Error decoding {self.id} text: {e}\n")
+        return encoding, language, description, text
+
+    def _comm(self):
+        # come back to this later
+        # text and desc seem to work on some and not others
+        encoding, language, description, text = self._lang_desc()
+
+        # decode(..., "ignore") cannot raise, so no error path here.
+        ftext = text.strip(b"\x00").decode(encoding, "ignore")
+        ftext = ftext.translate(_STRIP_CONTROL)
 
         return (self.id, (description, ftext))
 
@@ -385,10 +703,11 @@ class Frames:
         timestamp_format = self.body[0]
         tempo_codes = self.body[1]
 
-        timestamp_desc = {
-            1: "Absolute time, 32 bit sized, using MPEG frames as unit",
-            2: "Absolute time, 32 bit sized, using milliseconds as unit",
-        }.get(timestamp_format, "Unknown format")
+        timestamp_desc = (
+            _TIMESTAMP_FORMATS[timestamp_format]
+            if timestamp_format < len(_TIMESTAMP_FORMATS)
+            else "Unknown format"
+        )
 
         # RANGE = 2 - 510BPM
         # timestamp format $01 MPEG frames
@@ -402,74 +721,38 @@ class Frames:
         return "Not Implemented"
 
     def _uslt(self):
-        encoding = self._encode()
-
-        try:
-            language = self.body[:3].decode("ISO-8859-1").replace("\x00", "")
-        except Exception as e:
-            language = None
-            print(f"Error decoding language: {e}")
-
-        description, null_sep, lyrics = self.body[3:].partition(b"\x00")
-
-        try:
-            description = description.decode(encoding)
-        except Exception as e:
-            description = None
-            print(f"Error decoding description: {e}")
+        encoding, language, description, lyrics = self._lang_desc()
 
-        try:
-            lyrics = lyrics.strip(b"\x00").decode(encoding, "ignore")
-            lyrics = "".join(
-                [char if 32 <= ord(char) <= 126 else char for char in lyrics]
-            )
-        except Exception as e:
-            lyrics = None
-            print(f"Error decoding lyrics: {e}")
+        lyrics = lyrics.strip(b"\x00").decode(encoding, "ignore")
+        lyrics = lyrics.translate(_STRIP_CONTROL)
 
         return (self.id, (description, lyrics))
 
     def _sylt(self):
-        encoding = self._encode()
-
-        try:
-            language = self.body[:3].decode("ISO-8859-1").replace("\x00", "")
-        except Exception as e:
-            language = None
-            print(f"Error decoding language: {e}")
+        encoding = self.encoding_str
+        language = self._language()
 
         timestamp_byte = self.body[3]
-        timestamp_format = {
-            1: "Absolute time, 32 bit sized, using MPEG frames as unit",
-            2: "Absolute time, 32 bit sized, using milliseconds as unit",
-        }.get(timestamp_byte, "Unknown format")
+        timestamp_format = (
+            _TIMESTAMP_FORMATS[timestamp_byte]
+            if timestamp_byte < len(_TIMESTAMP_FORMATS)
+            else "Unknown format"
+        )
 
         content_type_byte = self.body[4]
-        content_type = {
-            0: "Other",
-            1: "Lyrics",
-            2: "Text transcription",
-            3: "Movement/part name",
-            4: "Events",
-            5: "Chord",
-            6: "Trivia",
-            7: "URLs to webpages",
-            8: "URLs to images",
-        }.get(content_type_byte, "Unknown content type")
+        content_type = (
+            _SYLT_CONTENT_TYPES[content_type_byte]
+            if content_type_byte < len(_SYLT_CONTENT_TYPES)
+            else "Unknown content type"
+        )
 
-        try:
-            description_end = self.body[5:].find(b"\x00")
-            if description_end == -1:
-                description = self.body[5:].decode(encoding, "ignore").strip()
-            else:
-                description = (
-                    self.body[5 : 5 + description_end]
-                    .decode(encoding, "ignore")
-                    .strip()
-                )
-        except Exception as e:
-            description = None
-            print(f"Error decoding description: {e}")
+        description_end = self.body[5:].find(b"\x00")
+        if description_end == -1:
+            description = self.body[5:].decode(encoding, "ignore").strip()
+        else:
+            description = (
+                self.body[5 : 5 + description_end].decode(encoding, "ignore").strip()
+            )
 
         # all methods that return "Not Implemented"
         # will be implemented after manual tests are created
@@ -485,37 +768,66 @@ class Frames:
         return "Not Implemented"
 
     def _apic(self):
-        encoding = self._encode()
-
-        mime_type, null_sep, frame_body = self.body.partition(b"\x00")
-        mime_type = mime_type.decode("utf-8")
-
-        picture_type = frame_body[0]
-        frame_body = frame_body[1:]
+        encoding = self.encoding_str
+        # Work on full_body directly (offset 1 skips the encoding byte)
+        # so the lazy body slice is never materialized for pictures.
+        body = self.full_body
+
+        # The MIME type and description sit at the start of the frame;
+        # bound the null searches there so the (possibly multi-MB) image
+        # payload is never scanned, and touch the payload only when it
+        # is actually written out.
+        mime_end = body.find(b"\x00", 1, 129)
+        if mime_end == -1:
+            mime_end = body.find(b"\x00", 1)
+        # Truncated frames end at (or before) the MIME terminator, or
+        # never terminate the description; drop them rather than
+        # indexing past the end and aborting the whole tag.
+        if mime_end == -1 or mime_end + 1 >= len(body):
+            return None
+        mime_type = body[1:mime_end].decode("utf-8")
 
-        description, null_sep, frame_body = frame_body.partition(b"\x00")
-        description = description.decode(encoding)
+        picture_type = body[mime_end + 1]
+        # Arbitrary bytes show up here in the wild; the spec only
+        # defines $00-$14.
+        picture_desc = PICTURE_TYPE.get(picture_type, "Reserved/Unknown")
 
-        picture_data = frame_body
+        desc_end = body.find(b"\x00", mime_end + 2)
+        if desc_end == -1:
+            return None
+        description = body[mime_end + 2 : desc_end].decode(encoding)
 
         if description == "":
             description = "image"
 
         if self.save_image:
-            if picture_type != 2:
-                with open(f"{description}.jpg", "wb") as file:
-                    file.write(picture_data)
-                    print(f"Image saved to {description}.jpg\n")
-
-            else:
-                with open(f"{description}.png", "wb") as file:
-                    file.write(picture_data)
-                    print(f"Image saved to {description}.png\n")
+            picture_data = memoryview(body)[desc_end + 1 :]
+            # The extension follows the declared MIME type; picture_type
+            # describes the image's role (cover, icon, ...), not its
+            # format, so it has no say here.
+            extension = _MIME_EXT.get(mime_type.lower(), ".bin")
+            # The description is untrusted frame data; keep only the
+            # final path component so it cannot escape the working
+            # directory.
+            safe_name = Path(description).name
+            if safe_name in ("", ".", ".."):
+                safe_name = "image"
+            filename = f"{safe_name}{extension}"
+            # Write the payload in one unbuffered syscall instead of
+            # copying it through an 8KiB BufferedWriter.
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                written = os.write(fd, picture_data)
+                while written < len(picture_data):
+                    written += os.write(fd, picture_data[written:])
+            finally:
+                os.close(fd)
+            print(f"Image saved to {filename}\n")
 
-        return (self.id, (mime_type, PICTURE_TYPE[picture_type], description))
+        return (self.id, (mime_type, picture_desc, description))
 
     def _geob(self):
-        encoding = self._encode()
+        encoding = self.encoding_str
         mime_type, null_sep, frame_body = self.body.partition(b"\x00")
         mime_type = mime_type.decode("ISO-8859-1")
 
@@ -581,6 +893,29 @@ class Frames:
         return "Not Implemented"
 
 
+# Dispatch table for frames with a dedicated handler, resolved once at
+# import instead of hasattr/getattr string lookups per frame.
+Frames._HANDLERS = {
+    name[1:].upper(): func
+    for name, func in vars(Frames).items()
+    if name.startswith("_") and len(name) == 5 and callable(func)
+}
+
+# Known frame identifiers pre-encoded as bytes keys, so the hot loop
+# reuses one interned str per id instead of decoding a fresh 4-char
+# string for every frame of every file.
+_ID_CACHE = {
+    name.encode("ascii"): name
+    for name in (
+        *Frames._HANDLERS,
+        *_URL_FRAMES,
+        "MCDI", "TXXX", "WXXX", "TIT2", "TIT1", "TIT3", "TPE1", "TPE2",
+        "TALB", "TCON", "TRCK", "TPOS", "TYER", "TDRC", "TLEN", "TENC",
+        "TSSE", "TFLT", "TCOM", "TCOP", "TPUB", "TBPM", "TKEY", "TLAN",
+    )
+}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract content from both TAGV1 and TAGV2 data spaces."
@@ -3,6 +3,24 @@ import mimetypes
 
 from pathlib import Path
 
+# Build the mimetypes DB once at import so no caller pays the lazy
+# first-use initialization inside guess_type/guess_extension.
+mimetypes.init()
+
+# Marks a per-instance cache slot as not yet computed (None is a valid
+# cached value for the mime type and extension).
+_UNSET = object()
+
+# Parsed once at import; __str__ fills it from the cached to_dict().
+_INFO_FMT = (
+    "File Name: {file_name}\n"
+    "MIME Type: {mime_type}\n"
+    "File Extension: {file_extension}\n"
+    "File Size: {file_size} bytes\n"
+    "File Size (mb): {file_size_in_mb} mb\n"
+    "RFC: {rfc}\n"
+).format_map
+
 
 class Info:
     """
@@ -17,22 +35,49 @@ class Info:
         print(info)
     """
 
+    __slots__ = ("audio", "_mime_type", "_extension", "_size")
+
     def __init__(self, audio: Path):
         self.audio = audio
+        # Cached per instance; a functools.cache keyed on self would
+        # retain every Info object for the life of the process.
+        self._mime_type = _UNSET
+        self._extension = _UNSET
+        self._size = None
 
     def _fname(self):
         return self.audio.name
 
     def _mime(self):
-        mime, _ = mimetypes.guess_type(self.audio)
-        return mime
+        if self._mime_type is _UNSET:
+            # The common case is known up front; only fall back to the
+            # mimetypes DB (built from disk on first use) for other
+            # files.
+            if self.audio.suffix.lower() == ".mp3":
+                self._mime_type = "audio/mpeg"
+            else:
+                mime, _ = mimetypes.guess_type(self.audio)
+                self._mime_type = mime
+
+        return self._mime_type
 
     def _fext(self):
-        if self._mime():
-            return mimetypes.guess_extension(self._mime())
+        if self._extension is _UNSET:
+            mime = self._mime()
+            if mime == "audio/mpeg":
+                self._extension = ".mp3"
+            elif mime:
+                self._extension = mimetypes.guess_extension(mime)
+            else:
+                self._extension = None
+
+        return self._extension
 
     def _fsize(self):
-        return self.audio.stat().st_size
+        if self._size is None:
+            self._size = self.audio.stat().st_size
+
+        return self._size
 
     def _fsize_to_mb(self):
         return round(self._fsize() / (2**20), 2)
@@ -41,6 +86,8 @@ class Info:
         return 3003
 
     def to_dict(self):
+        # Built fresh per call (callers may mutate it); the underlying
+        # values are cached on the instance.
         return {
             "file_name": self._fname(),
             "mime_type": self._mime(),
@@ -51,15 +98,7 @@ class Info:
         }
 
     def __str__(self):
-        info_dict = self.to_dict()
-        return (
-            f"File Name: {info_dict['file_name']}\n"
-            f"MIME Type: {info_dict['mime_type']}\n"
-            f"File Extension: {info_dict['file_extension']}\n"
-            f"File Size: {info_dict['file_size']} bytes\n"
-            f"File Size (mb): {info_dict['file_size_in_mb']} mb\n"
-            f"RFC: {info_dict['rfc']}\n"
-        )
+        return _INFO_FMT(self.to_dict())
 
 
 def main():
@@ -6,7 +6,7 @@ from typing import BinaryIO
 from mpegi.namespace import (
     MPEG_AUDIO,
     LAYERS,
-    BITRATE_INDEX,
+    BITRATE_TABLE,
     CHANNELS,
     JOINT_STEREO_MODE_EXTENSIONS_L1_2,
     JOINT_STEREO_MODE_EXTENSIONS_L3,
@@ -15,17 +15,62 @@ from mpegi.namespace import (
 )
 from mpegi.utils import frame_header
 
+# Interned single-bit strings returned by the bit getters.
+_BIT = ("0", "1")
+
 
 class Metadata:
     """
     Obtains metadata from MP3.
     """
 
+    __slots__ = (
+        "audio",
+        "stream",
+        "sync",
+        "header",
+        "hdr",
+        "_version",
+        "_layer",
+        "_bitrate",
+        "_sample_rate",
+        "_channel",
+        "_length",
+    )
+
     def __init__(self, audio: Path):
         self.audio = audio
         self.stream: BinaryIO = self.audio.open("rb")
-        self.sync = frame_header(self.stream)[0]
-        self.header = str(frame_header(self.stream)[1])
+        sync, header = frame_header(self.stream)
+        # Keep the bit-string forms for display; accessors mask and
+        # shift the integer header.
+        self.sync = format(sync, "b")
+        self.header = format(header, "032b")
+        self.hdr = header
+        # Derived fields are computed once per instance. A global
+        # functools.cache keyed on self would pin every instance (and
+        # its open stream) for the life of the process -- fatal for
+        # Metadata.scan sweeps.
+        self._version = MPEG_AUDIO[(header >> 19) & 0b11]
+        self._layer = LAYERS[(header >> 17) & 0b11]
+        self._sample_rate = SAMPLING_RATE_FREQUENCY[(header >> 10) & 0b11]
+        self._channel = self._read_channel()
+        self._bitrate = self._read_bitrate()
+        self._length = self._read_length()
+
+    @classmethod
+    def scan(cls, paths):
+        """
+        Lazily yields (path, Metadata) pairs for a batch of MP3s.
+
+        Files whose frame header cannot be parsed are skipped, so a
+        directory sweep is not aborted by one corrupt file.
+        """
+        for path in paths:
+            try:
+                yield path, cls(path)
+            except Exception:
+                continue
 
     def get_header(self):
         """Returns frame header."""
@@ -37,44 +82,32 @@ class Metadata:
 
     def get_version(self):
         """Returns MPEG Version ID"""
-        return MPEG_AUDIO[self.header[11:13]]
+        return self._version
 
     def get_layer(self):
         """Layer"""
-        return LAYERS[self.header[13:15]]
+        return self._layer
 
     def get_crc(self):
         """Returns CRC Protection bit."""
-        return self.header[15]
+        return _BIT[(self.hdr >> 16) & 1]
 
     def get_bitrate(self):
         """Returns bitrate."""
-        # dependent on version and layer
-        version = self.get_version()
-        layer = self.get_layer()
-
-        if version == "RESERVED" or layer == "RESERVED":
-            return "BAD"
-
+        return self._bitrate
+
+    def _read_bitrate(self):
+        # Version, layer and bitrate-index bits packed into one table
+        # index -- see namespace.BITRATE_TABLE.
+        bitrate = BITRATE_TABLE[
+            ((self.hdr >> 13) & 0b11110000) | ((self.hdr >> 12) & 0b1111)
+        ]
+        # Layer II (bits 0b10) has disallowed bitrate/mode combinations
         if (
-            version == "MPEG Version 2.5"
-            or version == "MPEG Version 2 (ISO/IEC 13818-3)"
+            (self.hdr >> 17) & 0b11 == 0b10
+            and bitrate != "FREE"
+            and bitrate != "BAD"
         ):
-            if layer == "Layer I":
-                verlay = "V2_L1"
-            else:
-                verlay = "V2_L2_3"
-
-        elif version == "MPEG Version 1 (ISO/IEC 11172-3)":
-            if layer == "Layer I":
-                verlay = "V1_L1"
-            elif layer == "Layer II":
-                verlay = "V1_L2"
-            else:
-                verlay = "V1_L3"
-
-        bitrate = BITRATE_INDEX[self.header[16:20]][verlay]
-        if layer == "Layer II" and bitrate != "FREE" and bitrate != "BAD":
             return self._verify_bitrate(bitrate)
 
         return bitrate
@@ -92,7 +125,7 @@ class Metadata:
         SINGLE_CHANNEL = [32, 48, 56, 80]
         OTHER_CHANNELS = [224, 256, 320, 384]
 
-        mode = self.get_channel()
+        mode = self._channel
         if bitrate in ALL:
             return bitrate
 
@@ -109,19 +142,22 @@ class Metadata:
 
     def get_sample_rate(self):
         """Returns audio sample rate in Hz."""
-        return SAMPLING_RATE_FREQUENCY[self.header[20:22]]
+        return self._sample_rate
 
     def get_padding(self):
         """Returns padding bit."""
-        return self.header[22]
+        return _BIT[(self.hdr >> 9) & 1]
 
     def get_private(self):
         """Returns private bit."""
-        return self.header[23]
+        return _BIT[(self.hdr >> 8) & 1]
 
     def get_channel(self):
         """Returns channel mode as well as extension if Joint Stereo."""
-        channel = CHANNELS[self.header[24:26]]
+        return self._channel
+
+    def _read_channel(self):
+        channel = CHANNELS[(self.hdr >> 6) & 0b11]
         if channel == "Joint Stereo":
             return (channel, self._get_extension())
 
@@ -131,58 +167,62 @@ class Metadata:
         """Returns the mode extension."""
         layer = self.get_layer()
         if layer == "Layer III":
-            return JOINT_STEREO_MODE_EXTENSIONS_L3[self.header[26:28]]
+            return JOINT_STEREO_MODE_EXTENSIONS_L3[(self.hdr >> 4) & 0b11]
 
-        return JOINT_STEREO_MODE_EXTENSIONS_L1_2[self.header[26:28]]
+        return JOINT_STEREO_MODE_EXTENSIONS_L1_2[(self.hdr >> 4) & 0b11]
 
     def get_copyright(self):
         """Returns copyright bit."""
-        return self.header[28]
+        return _BIT[(self.hdr >> 3) & 1]
 
     def get_original(self):
         """Returns original media bit."""
-        return self.header[29]
+        return _BIT[(self.hdr >> 2) & 1]
 
     def get_emphasis(self):
         """Returns emphasis."""
-        return EMPHASIS[self.header[30:32]]
+        return EMPHASIS[self.hdr & 0b11]
 
-    # ex
     def get_length(self):
-        """Attempts to calculate frame length in bytes."""
-        frame_length = None
-        layer = self.get_layer()
-        bitrate = self.get_bitrate()
-        sample_rate = self.get_sample_rate()
-        padding = self.get_padding()
+        """
+        Returns frame length in bytes.
 
-        try:
-            if layer == "Layer I":
-                frame_length = ((12 * bitrate) / sample_rate + int(padding)) * 4
-            else:
-                frame_length = (144 * bitrate * 1000 / sample_rate) + int(padding)
-            frame_length = round(frame_length)
+        None when the header carries a FREE/BAD bitrate or a reserved
+        sample rate, instead of computing on garbage.
+        """
+        return self._length
+
+    def _read_length(self):
+        bitrate = self._bitrate
+        sample_rate = self._sample_rate
+        if not isinstance(bitrate, int) or not isinstance(sample_rate, int):
+            return None
 
-        except Exception:
-            return Exception("Issue with calculating frame length.")
+        padding = (self.hdr >> 9) & 1
+        if (self.hdr >> 17) & 0b11 == 0b11:  # Layer I
+            return (round(12 * bitrate * 1000 / sample_rate) + padding) * 4
 
-        return frame_length
+        return round(144 * bitrate * 1000 / sample_rate) + padding
 
     def __str__(self):
-        return f"""
-    Version         {self.get_version()}
-    Layer           {self.get_layer()}
-    CRC             {self.get_crc()}
-    Bitrate         {self.get_bitrate()}
-    Sample Rate     {self.get_sample_rate()}
-    Padding         {self.get_padding()}
-    Private         {self.get_private()}
-    Channel         {self.get_channel()}
-    Copyright       {self.get_copyright()}
-    Original        {self.get_original()}
-    Emphasis        {self.get_emphasis()}
-    Frame Length    {self.get_length()}
-    """
+        # Fetch each field once and join; output matches the old
+        # f-string block exactly.
+        fields = (
+            ("Version", self.get_version()),
+            ("Layer", self.get_layer()),
+            ("CRC", self.get_crc()),
+            ("Bitrate", self.get_bitrate()),
+            ("Sample Rate", self.get_sample_rate()),
+            ("Padding", self.get_padding()),
+            ("Private", self.get_private()),
+            ("Channel", self.get_channel()),
+            ("Copyright", self.get_copyright()),
+            ("Original", self.get_original()),
+            ("Emphasis", self.get_emphasis()),
+            ("Frame Length", self.get_length()),
+        )
+        lines = "\n".join(f"    {label:<16}{value}" for label, value in fields)
+        return f"\n{lines}\n    "
 
 
 def main():
@@ -1,153 +1,263 @@
-GENRES = {
-    0: "Blues",
-    1: "Classic Rock",
-    2: "Country",
-    3: "Dance",
-    4: "Disco",
-    5: "Funk",
-    6: "Grunge",
-    7: "Hip-Hop",
-    8: "Jazz",
-    9: "Metal",
-    10: "New Age",
-    11: "Oldies",
-    12: "Other",
-    13: "Pop",
-    14: "R&B",
-    15: "Rap",
-    16: "Reggae",
-    17: "Rock",
-    18: "Techno",
-    19: "Industrial",
-    20: "Alternative",
-    21: "Ska",
-    22: "Death Metal",
-    23: "Pranks",
-    24: "Soundtrack",
-    25: "Euro-Techno",
-    26: "Ambient",
-    27: "Trip-Hop",
-    28: "Vocal",
-    29: "Jazz+Funk",
-    30: "Fusion",
-    31: "Trance",
-    32: "Classical",
-    33: "Instrumental",
-    34: "Acid",
-    35: "House",
-    36: "Game",
-    37: "Sound Clip",
-    38: "Gospel",
-    39: "Noise",
-    40: "AlternRock",
-    41: "Bass",
-    42: "Soul",
-    43: "Punk",
-    44: "Space",
-    45: "Meditative",
-    46: "Instrumental Pop",
-    47: "Instrumental Rock",
-    48: "Ethnic",
-    49: "Gothic",
-    50: "Darkwave",
-    51: "Techno-Industrial",
-    52: "Electronic",
-    53: "Pop-Folk",
-    54: "Eurodance",
-    55: "Dream",
-    56: "Southern Rock",
-    57: "Comedy",
-    58: "Cult",
-    59: "Gangsta",
-    60: "Top 40",
-    61: "Christian Rap",
-    62: "Pop/Funk",
-    63: "Jungle",
-    64: "Native American",
-    65: "Cabaret",
-    66: "New Wave",
-    67: "Psychadelic",
-    68: "Rave",
-    69: "Showtunes",
-    70: "Trailer",
-    71: "Lo-Fi",
-    72: "Tribal",
-    73: "Acid Punk",
-    74: "Acid Jazz",
-    75: "Polka",
-    76: "Retro",
-    77: "Musical",
-    78: "Rock & Roll",
-    79: "Hard Rock",
-    80: "Folk",
-    81: "Folk-Rock",
-    82: "National Folk",
-    83: "Swing",
-    84: "Fast Fusion",
-    85: "Bebob",
-    86: "Latin",
-    87: "Revival",
-    88: "Celtic",
-    89: "Bluegrass",
-    90: "Avantgarde",
-    91: "Gothic Rock",
-    92: "Progressive Rock",
-    93: "Psychedelic Rock",
-    94: "Symphonic Rock",
-    95: "Slow Rock",
-    96: "Big Band",
-    97: "Chorus",
-    98: "Easy Listening",
-    99: "Acoustic",
-    100: "Humour",
-    101: "Speech",
-    102: "Chanson",
-    103: "Opera",
-    104: "Chamber Music",
-    105: "Sonata",
-    106: "Symphony",
-    107: "Booty Bass",
-    108: "Primus",
-    109: "Porn Groove",
-    110: "Satire",
-    111: "Slow Jam",
-    112: "Club",
-    113: "Tango",
-    114: "Samba",
-    115: "Folklore",
-    116: "Ballad",
-    117: "Power Ballad",
-    118: "Rhythmic Soul",
-    119: "Freestyle",
-    120: "Duet",
-    121: "Punk Rock",
-    122: "Drum Solo",
-    123: "A capella",
-    124: "Euro-House",
-    125: "Dance Hall",
-    126: "Goa",
-    127: "Drum & Bass",
-    128: "Club-House",
-    129: "Hardcore",
-    130: "Terror",
-    131: "Indie",
-    132: "BritPop",
-    133: "Negerpunk",
-    134: "Polsk Punk",
-    135: "Beat",
-    136: "Christian Gangsta",
-    137: "Heavy Metal",
-    138: "Black Metal",
-    139: "Crossover",
-    140: "Contemporary Christian",
-    141: "Christian Rock",
-    142: "Merengue",
-    143: "Salsa",
-    144: "Thrash Metal",
-    145: "Anime",
-    146: "JPop",
-    147: "Synthpop",
-}
+# ID3v1 genre names indexed by the raw genre byte; padded to 256
+# entries so the byte can be used as an index without a bounds check.
+GENRES = (
+    "Blues",
+    "Classic Rock",
+    "Country",
+    "Dance",
+    "Disco",
+    "Funk",
+    "Grunge",
+    "Hip-Hop",
+    "Jazz",
+    "Metal",
+    "New Age",
+    "Oldies",
+    "Other",
+    "Pop",
+    "R&B",
+    "Rap",
+    "Reggae",
+    "Rock",
+    "Techno",
+    "Industrial",
+    "Alternative",
+    "Ska",
+    "Death Metal",
+    "Pranks",
+    "Soundtrack",
+    "Euro-Techno",
+    "Ambient",
+    "Trip-Hop",
+    "Vocal",
+    "Jazz+Funk",
+    "Fusion",
+    "Trance",
+    "Classical",
+    "Instrumental",
+    "Acid",
+    "House",
+    "Game",
+    "Sound Clip",
+    "Gospel",
+    "Noise",
+    "AlternRock",
+    "Bass",
+    "Soul",
+    "Punk",
+    "Space",
+    "Meditative",
+    "Instrumental Pop",
+    "Instrumental Rock",
+    "Ethnic",
+    "Gothic",
+    "Darkwave",
+    "Techno-Industrial",
+    "Electronic",
+    "Pop-Folk",
+    "Eurodance",
+    "Dream",
+    "Southern Rock",
+    "Comedy",
+    "Cult",
+    "Gangsta",
+    "Top 40",
+    "Christian Rap",
+    "Pop/Funk",
+    "Jungle",
+    "Native American",
+    "Cabaret",
+    "New Wave",
+    "Psychadelic",
+    "Rave",
+    "Showtunes",
+    "Trailer",
+    "Lo-Fi",
+    "Tribal",
+    "Acid Punk",
+    "Acid Jazz",
+    "Polka",
+    "Retro",
+    "Musical",
+    "Rock & Roll",
+    "Hard Rock",
+    "Folk",
+    "Folk-Rock",
+    "National Folk",
+    "Swing",
+    "Fast Fusion",
+    "Bebob",
+    "Latin",
+    "Revival",
+    "Celtic",
+    "Bluegrass",
+    "Avantgarde",
+    "Gothic Rock",
+    "Progressive Rock",
+    "Psychedelic Rock",
+    "Symphonic Rock",
+    "Slow Rock",
+    "Big Band",
+    "Chorus",
+    "Easy Listening",
+    "Acoustic",
+    "Humour",
+    "Speech",
+    "Chanson",
+    "Opera",
+    "Chamber Music",
+    "Sonata",
+    "Symphony",
+    "Booty Bass",
+    "Primus",
+    "Porn Groove",
+    "Satire",
+    "Slow Jam",
+    "Club",
+    "Tango",
+    "Samba",
+    "Folklore",
+    "Ballad",
+    "Power Ballad",
+    "Rhythmic Soul",
+    "Freestyle",
+    "Duet",
+    "Punk Rock",
+    "Drum Solo",
+    "A capella",
+    "Euro-House",
+    "Dance Hall",
+    "Goa",
+    "Drum & Bass",
+    "Club-House",
+    "Hardcore",
+    "Terror",
+    "Indie",
+    "BritPop",
+    "Negerpunk",
+    "Polsk Punk",
+    "Beat",
+    "Christian Gangsta",
+    "Heavy Metal",
+    "Black Metal",
+    "Crossover",
+    "Contemporary Christian",
+    "Christian Rock",
+    "Merengue",
+    "Salsa",
+    "Thrash Metal",
+    "Anime",
+    "JPop",
+    "Synthpop",
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+)
 
 PICTURE_TYPE = {
     0: "Other",
@@ -173,78 +283,114 @@ PICTURE_TYPE = {
     14: "Publisher/Studio logotype",
 }
 
-MPEG_AUDIO = {
-    "00": "MPEG Version 2.5",
-    "01": "RESERVED",
-    "10": "MPEG Version 2 (ISO/IEC 13818-3)",
-    "11": "MPEG Version 1 (ISO/IEC 11172-3)",
-}
+# Indexed by the 2-bit version field.
+MPEG_AUDIO = (
+    "MPEG Version 2.5",
+    "RESERVED",
+    "MPEG Version 2 (ISO/IEC 13818-3)",
+    "MPEG Version 1 (ISO/IEC 11172-3)",
+)
 
-LAYERS = {"00": "RESERVED", "01": "Layer III", "10": "Layer II", "11": "Layer I"}
+# Indexed by the 2-bit layer field.
+LAYERS = ("RESERVED", "Layer III", "Layer II", "Layer I")
 
 # CRC = {"0": "Protected by CRC (16bit CRC follows header)", "1": "Not Protected"}
 
-BITRATE_INDEX = {
-    "0000": {
+# Indexed by the 4-bit bitrate field; flattened further into
+# BITRATE_TABLE below.
+BITRATE_INDEX = (
+    {
         "V1_L1": "FREE",
         "V1_L2": "FREE",
         "V1_L3": "FREE",
         "V2_L1": "FREE",
         "V2_L2_3": "FREE",
     },
-    "0001": {"V1_L1": 32, "V1_L2": 32, "V1_L3": 32, "V2_L1": 32, "V2_L2_3": 8},
-    "0010": {"V1_L1": 64, "V1_L2": 48, "V1_L3": 40, "V2_L1": 48, "V2_L2_3": 16},
-    "0011": {"V1_L1": 96, "V1_L2": 56, "V1_L3": 48, "V2_L1": 56, "V2_L2_3": 24},
-    "0100": {"V1_L1": 128, "V1_L2": 64, "V1_L3": 56, "V2_L1": 64, "V2_L2_3": 32},
-    "0101": {"V1_L1": 160, "V1_L2": 80, "V1_L3": 64, "V2_L1": 80, "V2_L2_3": 40},
-    "0110": {"V1_L1": 192, "V1_L2": 96, "V1_L3": 80, "V2_L1": 96, "V2_L2_3": 48},
-    "0111": {"V1_L1": 224, "V1_L2": 112, "V1_L3": 96, "V2_L1": 112, "V2_L2_3": 56},
-    "1000": {"V1_L1": 256, "V1_L2": 128, "V1_L3": 112, "V2_L1": 128, "V2_L2_3": 64},
-    "1001": {"V1_L1": 288, "V1_L2": 160, "V1_L3": 128, "V2_L1": 144, "V2_L2_3": 80},
-    "1010": {"V1_L1": 320, "V1_L2": 192, "V1_L3": 160, "V2_L1": 160, "V2_L2_3": 96},
-    "1011": {"V1_L1": 352, "V1_L2": 224, "V1_L3": 192, "V2_L1": 176, "V2_L2_3": 112},
-    "1100": {"V1_L1": 384, "V1_L2": 256, "V1_L3": 224, "V2_L1": 192, "V2_L2_3": 128},
-    "1101": {"V1_L1": 416, "V1_L2": 320, "V1_L3": 256, "V2_L1": 224, "V2_L2_3": 144},
-    "1110": {"V1_L1": 448, "V1_L2": 384, "V1_L3": 320, "V2_L1": 256, "V2_L2_3": 160},
-    "1111": {
+    {"V1_L1": 32, "V1_L2": 32, "V1_L3": 32, "V2_L1": 32, "V2_L2_3": 8},
+    {"V1_L1": 64, "V1_L2": 48, "V1_L3": 40, "V2_L1": 48, "V2_L2_3": 16},
+    {"V1_L1": 96, "V1_L2": 56, "V1_L3": 48, "V2_L1": 56, "V2_L2_3": 24},
+    {"V1_L1": 128, "V1_L2": 64, "V1_L3": 56, "V2_L1": 64, "V2_L2_3": 32},
+    {"V1_L1": 160, "V1_L2": 80, "V1_L3": 64, "V2_L1": 80, "V2_L2_3": 40},
+    {"V1_L1": 192, "V1_L2": 96, "V1_L3": 80, "V2_L1": 96, "V2_L2_3": 48},
+    {"V1_L1": 224, "V1_L2": 112, "V1_L3": 96, "V2_L1": 112, "V2_L2_3": 56},
+    {"V1_L1": 256, "V1_L2": 128, "V1_L3": 112, "V2_L1": 128, "V2_L2_3": 64},
+    {"V1_L1": 288, "V1_L2": 160, "V1_L3": 128, "V2_L1": 144, "V2_L2_3": 80},
+    {"V1_L1": 320, "V1_L2": 192, "V1_L3": 160, "V2_L1": 160, "V2_L2_3": 96},
+    {"V1_L1": 352, "V1_L2": 224, "V1_L3": 192, "V2_L1": 176, "V2_L2_3": 112},
+    {"V1_L1": 384, "V1_L2": 256, "V1_L3": 224, "V2_L1": 192, "V2_L2_3": 128},
+    {"V1_L1": 416, "V1_L2": 320, "V1_L3": 256, "V2_L1": 224, "V2_L2_3": 144},
+    {"V1_L1": 448, "V1_L2": 384, "V1_L3": 320, "V2_L1": 256, "V2_L2_3": 160},
+    {
         "V1_L1": "BAD",
         "V1_L2": "BAD",
         "V1_L3": "BAD",
         "V2_L1": "BAD",
         "V2_L2_3": "BAD",
     },
-}
+)
 
-CHANNELS = {
-    "00": "Stereo",
-    "01": "Joint Stereo",
-    "10": "Dual",
-    "11": "Mono (single channel)",
-}
 
-JOINT_STEREO_MODE_EXTENSIONS_L1_2 = {
-    "00": "Bands 4 to 31",
-    "01": "Bands 8 to 31",
-    "10": "Bands 12 to 31",
-    "11": "Bands 16 to 31",
-}
-JOINT_STEREO_MODE_EXTENSIONS_L3 = {
-    "00": "Intensity Stereo [OFF] -- MS Stereo [Off]",
-    "01": "Intensity Stereo [ON] -- MS Stereo [Off]",
-    "10": "Intensity Stereo [OFF] -- MS Stereo [ON]",
-    "11": "Intensity Stereo [ON] -- MS Stereo [ON]",
-}
+def _build_bitrate_table():
+    """
+    Flattens BITRATE_INDEX into a 256-entry tuple indexed by
+    (version_bits << 6) | (layer_bits << 4) | bitrate_index, so
+    get_bitrate resolves in a single indexed load instead of a
+    version/layer ladder plus two dict lookups.
+    """
+    table = ["BAD"] * 256
+    for version in range(4):
+        for layer in range(4):
+            if MPEG_AUDIO[version] == "RESERVED" or LAYERS[layer] == "RESERVED":
+                continue
 
-SAMPLING_RATE_FREQUENCY = {
-    "00": 44100,  # Hz 44.1kHz
-    "01": 48000,  # Hz 48kHz
-    "10": 32000,  # Hz 32kHz
-    "11": "RESERVED",
-}
+            if version == 0b11:  # MPEG Version 1
+                verlay = {"Layer I": "V1_L1", "Layer II": "V1_L2"}.get(
+                    LAYERS[layer], "V1_L3"
+                )
+            else:  # MPEG Version 2 / 2.5
+                verlay = "V2_L1" if LAYERS[layer] == "Layer I" else "V2_L2_3"
 
-EMPHASIS = {
-    "00": None,
-    "01": "50/15 ms",
-    "10": "RESERVED",
-    "11": "CCIT J.17",
-}
+            for index in range(16):
+                table[(version << 6) | (layer << 4) | index] = BITRATE_INDEX[
+                    index
+                ][verlay]
+
+    return tuple(table)
+
+
+BITRATE_TABLE = _build_bitrate_table()
+
+# Indexed by the 2-bit channel-mode field.
+CHANNELS = (
+    "Stereo",
+    "Joint Stereo",
+    "Dual",
+    "Mono (single channel)",
+)
+
+JOINT_STEREO_MODE_EXTENSIONS_L1_2 = (
+    "Bands 4 to 31",
+    "Bands 8 to 31",
+    "Bands 12 to 31",
+    "Bands 16 to 31",
+)
+JOINT_STEREO_MODE_EXTENSIONS_L3 = (
+    "Intensity Stereo [OFF] -- MS Stereo [Off]",
+    "Intensity Stereo [ON] -- MS Stereo [Off]",
+    "Intensity Stereo [OFF] -- MS Stereo [ON]",
+    "Intensity Stereo [ON] -- MS Stereo [ON]",
+)
+
+SAMPLING_RATE_FREQUENCY = (
+    44100,  # Hz 44.1kHz
+    48000,  # Hz 48kHz
+    32000,  # Hz 32kHz
+    "RESERVED",
+)
+
+EMPHASIS = (
+    None,
+    "50/15 ms",
+    "RESERVED",
+    "CCIT J.17",
+)
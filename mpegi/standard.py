@@ -1,5 +1,3 @@
-import mimetypes
-
 from pathlib import Path
 from typing import BinaryIO
 
@@ -24,6 +22,8 @@ class Standard:
     etc. Complete after metadata and core are complete.
     """
 
+    __slots__ = ("audio", "stream")
+
     def __init__(self, audio: Path):
         self.audio = audio
         self.stream: BinaryIO = self.audio.open("rb")
@@ -38,10 +38,7 @@ class Standard:
             Tuple - (bool if extension is MP3, bool if file signature matches MP3)
         """
         signature = check_signature(self.audio)
-        mime, _ = mimetypes.guess_type(self.audio)
-        if mime:
-            extension = mimetypes.guess_extension(mime)
-            return (extension == MP3, signature)
+        return (self.audio.suffix.lower() == MP3, signature)
 
 
 if __name__ == "__main__":
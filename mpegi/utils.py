@@ -1,7 +1,18 @@
+import os
+
 from pathlib import Path
 from typing import BinaryIO, Tuple
 
 
+# Known MP3 signatures: ID3 plus the common frame-sync prefixes.
+_SIGNATURES = (
+    b"\x49\x44\x33",  # ID3
+    b"\xFF\xFB",  # ÿû
+    b"\xFF\xF3",  # ÿó
+    b"\xFF\xF2",  # ÿò
+)
+
+
 def check_signature(audio: Path) -> bool:
     """
     Validates an MP3 file by checking its file signature.
@@ -12,17 +23,15 @@ def check_signature(audio: Path) -> bool:
     Returns:
         True if the file signature matches known MP3 signatures, False otherwise.
     """
-    VALID_ISO = [
-        b"\x49\x44\x33",  # ID3
-        b"\xFF\xFB",  # ÿû
-        b"\xFF\xF3",  # ÿó
-        b"\xFF\xF2",  # ÿò
-    ]
-
-    with audio.open("rb") as stream:
-        signature = stream.read(3)
+    # One positioned read on a raw fd; no buffered stream setup for a
+    # 3-byte probe.
+    fd = os.open(audio, os.O_RDONLY)
+    try:
+        signature = os.pread(fd, 3, 0)
+    finally:
+        os.close(fd)
 
-    return any(signature in s for s in VALID_ISO)
+    return signature.startswith(_SIGNATURES)
 
 
 def rm_unsync(body: bytes) -> bytes:
@@ -44,7 +53,30 @@ def rm_unsync(body: bytes) -> bytes:
     return body.replace(b"\xFF\x00", b"\xFF")
 
 
-def frame_header(stream: BinaryIO) -> Tuple[str, str]:
+def syncsafe(data: bytes) -> int:
+    """
+    Decodes a 4-byte ID3v2 syncsafe integer.
+
+    Each byte only contributes its low 7 bits. Reading the four bytes
+    as one int and gathering the bit groups with masks is cheaper than
+    indexing, masking and shifting each byte separately.
+
+    Args:
+        data (bytes): The 4 syncsafe size bytes.
+
+    Returns:
+        int: The decoded 28-bit size.
+    """
+    n = int.from_bytes(data, "big")
+    return (
+        (n & 0x7F000000) >> 3
+        | (n & 0x007F0000) >> 2
+        | (n & 0x00007F00) >> 1
+        | (n & 0x7F)
+    )
+
+
+def frame_header(stream: BinaryIO) -> Tuple[int, int]:
     """
     Retrieves the frame header at the current position of the stream.
 
@@ -54,20 +86,15 @@ def frame_header(stream: BinaryIO) -> Tuple[str, str]:
         stream (BinaryIO): The MP3 file stream.
 
     Returns:
-        Tuple[str, str]: The frame sync bits and the frame header.
+        Tuple[int, int]: The frame sync bits and the 32-bit frame header,
+        both as integers.
     """
     # Account for TAGv2 space at start of file
     stream.seek(0)
     tag = stream.read(3)
     if tag == b"ID3":
         stream.seek(6)
-        sizeb = stream.read(4)
-        size = (
-            (sizeb[0] & 0x7F) << 21
-            | (sizeb[1] & 0x7F) << 14
-            | (sizeb[2] & 0x7F) << 7
-            | (sizeb[3] & 0x7F)
-        )
+        size = syncsafe(stream.read(4))
         stream.seek(10 + size)
     # No TAGv2 space
     else:
@@ -77,19 +104,17 @@ def frame_header(stream: BinaryIO) -> Tuple[str, str]:
     if len(header) != 4:
         raise Exception("Invalid Frame Header: Length is not 4 bytes.")
 
-    sync12 = (header[0] << 4) | (header[1] >> 4)
-    sync11 = (header[0] << 3) | (header[1] >> 5)
+    hdr = int.from_bytes(header, "big")
+
+    sync11 = (hdr >> 21) & 0x7FF
+    sync12 = (hdr >> 20) & 0xFFF
 
-    if (sync11 & 0x7FF) == 0x7FF:
-        sync = format(sync11, "011b")
+    if sync11 == 0x7FF:
+        sync = sync11
 
     elif (sync12 & 0xFFE) == 0xFFE:  # Check for 12-bit sync
-        sync = format(sync12, "012b")
+        sync = sync12
     else:
         raise Exception("Frame Synchronizer bits are not set to 1 (11 or 12).")
 
-    size = "".join(format(byte, "08b") for byte in header)
-    if len(size) != 32:
-        raise Exception(f"Header Size is not 32. (size: {size})")
-
-    return (sync, "".join(format(byte, "08b") for byte in header))
+    return (sync, hdr)
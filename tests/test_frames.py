@@ -84,3 +84,36 @@ def test_frame(body, id, size, expected):
     frame = instance.process_frame()
     print(expected)
     assert frame == expected
+
+
+APIC_MALFORMED = [
+    b"\x00image/jpeg",  # no MIME terminator
+    b"\x00image/jpeg\x00",  # ends at the picture-type byte
+    b"\x00image/jpeg\x00\x03cover",  # description never terminated
+    b"\x01",  # bare encoding byte
+]
+
+
+@pytest.mark.parametrize("body", APIC_MALFORMED)
+def test_truncated_apic_is_dropped(body):
+    instance = Frames(body, "APIC", len(body))
+    assert instance.process_frame() is None
+
+
+def test_apic_unknown_picture_type():
+    body = b"\x00image/jpeg\x00\xeecover\x00" + b"\x01" * 4
+    instance = Frames(body, "APIC", len(body))
+    frame = instance.process_frame()
+    assert frame == ("APIC", ("image/jpeg", "Reserved/Unknown", "cover"))
+
+
+def test_apic_saved_image_name_and_extension(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    body = b"\x00image/png\x00\x03../../cover\x00" + b"\x89PNG"
+    instance = Frames(body, "APIC", len(body), save_image=True)
+    frame = instance.process_frame()
+    assert frame == ("APIC", ("image/png", "Cover (front)", "../../cover"))
+    # The extension follows the MIME type and the description is
+    # sanitized so it cannot escape the working directory.
+    assert (tmp_path / "cover.png").read_bytes() == b"\x89PNG"
+    assert not (tmp_path.parent / "cover.png").exists()
@@ -47,3 +47,26 @@ class TestMetadata:
 
     def test_length(self):
         assert self.metadata.get_length() == 627
+
+
+class TestMetadataSynthetic:
+    """Header-level checks that run without the mp3 assets."""
+
+    # MPEG1 Layer III, 192kbps, 44100Hz, Joint Stereo
+    HEADER = b"\xff\xfb\xb0\x64"
+
+    def _metadata(self, tmp_path):
+        audio = tmp_path / "synthetic.mp3"
+        audio.write_bytes(self.HEADER + b"\x00" * 700)
+        return Metadata(audio)
+
+    def test_bitrate(self, tmp_path):
+        assert self._metadata(tmp_path).get_bitrate() == 192
+
+    def test_sample_rate(self, tmp_path):
+        assert self._metadata(tmp_path).get_sample_rate() == 44100
+
+    def test_length_rounds(self, tmp_path):
+        # Regression: 144 * 192000 / 44100 must round to 627, not
+        # floor to 626.
+        assert self._metadata(tmp_path).get_length() == 627
@@ -0,0 +1,101 @@
+import struct
+
+import pytest
+
+from mpegi.frames import Tag, read_tag
+
+
+def _syncsafe_bytes(n):
+    return bytes([(n >> 21) & 0x7F, (n >> 14) & 0x7F, (n >> 7) & 0x7F, n & 0x7F])
+
+
+def _v1(title=b"Title", genre=12):
+    return b"TAG" + title.ljust(30, b"\x00") + b"\x00" * 94 + bytes([genre])
+
+
+def _v2(*frames):
+    body = b"".join(
+        fid.encode() + struct.pack(">IH", len(data), 0) + data
+        for fid, data in frames
+    )
+    return b"ID3\x04\x00\x00" + _syncsafe_bytes(len(body)) + body
+
+
+def _write(tmp_path, content):
+    audio = tmp_path / "audio.mp3"
+    audio.write_bytes(content)
+    return audio
+
+
+GENRES_V1 = [
+    (0, "Blues"),
+    (12, "Other"),
+    # Regression: out-of-spec genre bytes (including the conventional
+    # 0xFF "no genre" marker) must map to None, not latin-1 mojibake.
+    (148, None),
+    (0xFF, None),
+]
+
+
+@pytest.mark.parametrize("genre, expected", GENRES_V1)
+def test_v1_genre(tmp_path, genre, expected):
+    audio = _write(tmp_path, b"\x00" * 256 + _v1(genre=genre))
+    assert Tag(audio).get()["Genre"] == expected
+
+
+def test_v2_frames(tmp_path):
+    audio = _write(tmp_path, _v2(("TIT2", b"\x00Hello"), ("TPE1", b"\x00Someone")))
+    frames = Tag(audio).get()["Frames"]
+    assert frames == {"TIT2": "Hello", "TPE1": "Someone"}
+
+
+def test_wanted_filter(tmp_path):
+    audio = _write(tmp_path, _v2(("TIT2", b"\x00Hello"), ("TPE1", b"\x00Someone")))
+    frames = Tag(audio).get(wanted={"TPE1"})["Frames"]
+    assert frames == {"TPE1": "Someone"}
+
+
+def test_wanted_overrides_heavy_skip(tmp_path):
+    # Regression: an explicitly wanted APIC used to be dropped by the
+    # save_image=False heavy-frame skip.
+    apic = b"\x00image/jpeg\x00\x03cover\x00" + b"\xff" * 8
+    audio = _write(tmp_path, _v2(("APIC", apic), ("TIT2", b"\x00Hello")))
+    frames = Tag(audio).get(wanted={"APIC"})["Frames"]
+    assert frames == {"APIC": ("image/jpeg", "Cover (front)", "cover")}
+
+
+def test_wanted_accepts_list(tmp_path):
+    audio = _write(tmp_path, _v2(("TIT2", b"\x00Hello"), ("TPE1", b"\x00Someone")))
+    frames = Tag(audio).get(wanted=["TIT2", "TPE1"])["Frames"]
+    assert frames == {"TIT2": "Hello", "TPE1": "Someone"}
+
+
+def test_truncated_apic_does_not_abort_tag(tmp_path):
+    # Regression: an APIC body ending at the MIME terminator used to
+    # raise IndexError and abort the whole parse.
+    audio = _write(
+        tmp_path, _v2(("APIC", b"\x00image/jpeg\x00"), ("TIT2", b"\x00Hello"))
+    )
+    frames = Tag(audio).get(save_image=True)["Frames"]
+    assert frames == {"TIT2": "Hello"}
+
+
+def test_read_tag_callers_get_independent_dicts(tmp_path):
+    # Regression: the memoized result was handed out by reference, so
+    # one caller's edits corrupted every later read_tag call.
+    audio = _write(tmp_path, _v2(("TIT2", b"\x00Hello")))
+    first = read_tag(audio)
+    first["Frames"]["TIT2"] = "clobbered"
+    first["Version"] = "clobbered"
+    second = read_tag(audio)
+    assert second["Version"] == "4.0"
+    assert second["Frames"] == {"TIT2": "Hello"}
+
+
+def test_scan_skips_unreadable(tmp_path):
+    good = _write(tmp_path, _v2(("TIT2", b"\x00Hello")))
+    bad = tmp_path / "bad.mp3"
+    bad.write_bytes(b"\x00" * 64)
+    results = dict(Tag.scan([good, bad]))
+    assert list(results) == [good]
+    assert results[good]["Frames"] == {"TIT2": "Hello"}
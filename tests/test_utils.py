@@ -0,0 +1,40 @@
+import pytest
+
+from mpegi.utils import check_signature, rm_unsync, syncsafe
+
+SIGNATURES = [
+    (b"\x49\x44\x33\x04\x00", True),  # ID3
+    (b"\xff\xfb\xb0\x64", True),  # MPEG1 Layer III frame sync
+    (b"\xff\xf3\x10\x00", True),
+    (b"\xff\xf2\x20\x00", True),
+    (b"RIFF1234", False),
+    # Regression: a suffix of a valid signature must not match
+    # (check_signature once tested `signature in s`, inverting the
+    # containment).
+    (b"\xfb\xb0\x64", False),
+    (b"\x44\x33\x04", False),
+]
+
+
+@pytest.mark.parametrize("prefix, expected", SIGNATURES)
+def test_check_signature(tmp_path, prefix, expected):
+    audio = tmp_path / "audio.mp3"
+    audio.write_bytes(prefix)
+    assert check_signature(audio) == expected
+
+
+SYNCSAFE = [
+    (b"\x00\x00\x00\x00", 0),
+    (b"\x00\x00\x02\x01", 257),
+    (b"\x00\x00\x7f\x7f", 16383),
+    (b"\x7f\x7f\x7f\x7f", 0x0FFFFFFF),
+]
+
+
+@pytest.mark.parametrize("data, expected", SYNCSAFE)
+def test_syncsafe(data, expected):
+    assert syncsafe(data) == expected
+
+
+def test_rm_unsync():
+    assert rm_unsync(b"\xff\x00\xab\xff\x00\x00") == b"\xff\xab\xff\x00"